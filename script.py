@@ -5,20 +5,93 @@ and uploads them to your Google Drive (flat—no subfolders).
 """
 
 import os
+import asyncio
 import base64
 import json
+import random
 import re
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 # Google API imports
+import google_auth_httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import io
-from googleapiclient.http import MediaIoBaseUpload
+from googleapiclient.http import MediaIoBaseUpload, build_http
+
+try:
+    import orjson  # optional, faster log serialization
+except ImportError:
+    orjson = None
+
+
+def dumps_json_line(obj: Any) -> bytes:
+    """Serialize obj as one UTF-8 JSON line, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(obj, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+class Base64StreamReader(io.RawIOBase):
+    """
+    Seekable, read-only stream over the bytes encoded in a URL-safe base64 string.
+    Only the requested range is decoded on each read, so a resumable upload never
+    holds more than one chunk of decoded data in memory.
+    """
+
+    def __init__(self, data: str):
+        # Keep a reference to the caller's string; stripping the padding would copy it
+        self._data = data
+        padding = 2 if data.endswith('==') else 1 if data.endswith('=') else 0
+        self._size = len(data) * 3 // 4 - padding
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:
+        n = min(len(buffer), self._size - self._pos)
+        if n <= 0:
+            return 0
+        # Every 4 base64 characters encode 3 bytes; decode just the groups covering the range
+        first_group = self._pos // 3
+        last_group = (self._pos + n + 2) // 3
+        encoded = self._data[first_group * 4:last_group * 4]
+        # Only an unpadded final group is short of a multiple of 4 characters
+        decoded = base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4))
+        skip = self._pos - first_group * 3
+        buffer[:n] = decoded[skip:skip + n]
+        self._pos += n
+        return n
 
 class GmailAttachmentDownloader:
     """Download PDF/DOCX attachments from Gmail and upload to Google Drive."""
@@ -28,6 +101,32 @@ class GmailAttachmentDownloader:
         "https://www.googleapis.com/auth/drive"
     ]
 
+    # Drive folder every attachment is uploaded into
+    DRIVE_FOLDER_ID = "0ANiWPPimuH4hUk9PVA"
+
+    # Attachment extensions Gmail is asked to filter on server-side
+    ATTACHMENT_EXTENSIONS = ('pdf', 'docx')
+    PDF_MIME_TYPE = 'application/pdf'
+    DOCX_MIME_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+    # messages.get costs 5 quota units, so one batch of 50 uses the whole 250 units/s
+    # per-user Gmail quota; larger batches are mostly answered with 429s
+    BATCH_SIZE = 50
+    # Partial response for messages.get: only the headers and MIME parts that are actually read.
+    # Nested 'parts' is left unfiltered so arbitrarily deep multiparts are returned whole.
+    MESSAGE_FIELDS = 'id,threadId,internalDate,payload(headers(name,value),parts(filename,mimeType,body,parts))'
+    # Upper bound on attachments downloaded/uploaded in flight at once
+    MAX_CONCURRENT_TRANSFERS = 16
+    # Resumable Drive uploads are sent in chunks of this size (must be a multiple of 256 KiB)
+    UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+    # Retries for API calls failing with a transient (rate limit / server) error
+    MAX_RETRIES = 5
+    RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+    # Dropped or timed-out connections; a resumable upload re-queries its offset before resending
+    RETRYABLE_TRANSPORT_ERRORS = (socket.timeout, ConnectionError)
+    # Upload log entries written between explicit flushes
+    LOG_FLUSH_INTERVAL = 20
+
     def __init__(self, credentials_file: str = 'credentials.json', token_file: str = 'token.json'):
         """
         Initialize the Gmail & Drive API clients.
@@ -38,7 +137,8 @@ class GmailAttachmentDownloader:
         self.credentials_file = credentials_file
         self.token_file = token_file
         self.gmail_service = None
-        self.drive_service = None
+        self._creds = None
+        self._local = threading.local()
         self._authenticate()
 
     def _authenticate(self):
@@ -68,8 +168,42 @@ class GmailAttachmentDownloader:
             
             with open(self.token_file, 'w') as token:
                 token.write(creds.to_json())
-        self.gmail_service = build('gmail', 'v1', credentials=creds)
-        self.drive_service = build('drive', 'v3', credentials=creds)
+        self._creds = creds
+        self.gmail_service = build('gmail', 'v1', http=self._authorized_http())
+
+    def _authorized_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """
+        Create a keep-alive HTTP client so requests reuse the TLS connection.
+        build_http() keeps the client library's socket timeout and stops httplib2
+        treating the 308 "Resume Incomplete" of a chunked upload as a redirect.
+        """
+        return google_auth_httplib2.AuthorizedHttp(self._creds, http=build_http())
+
+    def _thread_services(self):
+        """Return Gmail & Drive services owned by the calling thread (API clients are not thread-safe)."""
+        if not hasattr(self._local, 'gmail_service'):
+            self._local.gmail_service = build('gmail', 'v1', http=self._authorized_http())
+            self._local.drive_service = build('drive', 'v3', http=self._authorized_http())
+        return self._local.gmail_service, self._local.drive_service
+
+    @staticmethod
+    def _backoff(attempt: int):
+        """Sleep with exponential backoff plus jitter before retry number `attempt`."""
+        time.sleep(2 ** attempt + random.random())
+
+    def _with_retry(self, fn: Callable[[], Any]) -> Any:
+        """Call fn, retrying HttpErrors with a transient status code (429/5xx) and dropped connections."""
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                return fn()
+            except HttpError as error:
+                if error.resp.status not in self.RETRYABLE_STATUS_CODES or attempt == self.MAX_RETRIES:
+                    raise
+                self._backoff(attempt)
+            except self.RETRYABLE_TRANSPORT_ERRORS:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                self._backoff(attempt)
 
     def format_date_for_query(self, date_obj: datetime) -> str:
         return date_obj.strftime('%Y/%m/%d')
@@ -78,50 +212,88 @@ class GmailAttachmentDownloader:
         self, 
         start_date: datetime, 
         end_date: datetime,
-        additional_query: str = ""
+        additional_query: str = "",
+        file_types: Optional[Sequence[str]] = ATTACHMENT_EXTENSIONS
     ) -> List[Dict[str, Any]]:
-        """Search for messages with attachments within date range."""
+        """
+        Search for messages with attachments within date range.
+        Args:
+            file_types: Attachment extensions to filter on server-side, e.g. ('pdf', 'docx').
+                Gmail then skips messages with no matching attachment, saving a
+                messages.get per non-matching hit; pass None to search all attachments.
+        """
         try:
             query_parts = [
                 "has:attachment",
                 f"after:{self.format_date_for_query(start_date)}",
                 f"before:{self.format_date_for_query(end_date)}"
             ]
+            if file_types:
+                query_parts.append(
+                    "(" + " OR ".join(f"filename:{ext}" for ext in file_types) + ")"
+                )
             if additional_query:
                 query_parts.append(additional_query)
             query = " ".join(query_parts)
             print(f"Search query: {query}")
-            result = self.gmail_service.users().messages().list(
-                userId='me', q=query, maxResults=500
-            ).execute()
             messages = []
-            if 'messages' in result:
-                messages.extend(result['messages'])
-            while 'nextPageToken' in result:
-                page_token = result['nextPageToken']
-                result = self.gmail_service.users().messages().list(
+            page_token = None
+            while True:
+                result = self._with_retry(self.gmail_service.users().messages().list(
                     userId='me',
                     q=query,
                     pageToken=page_token,
                     maxResults=500
-                ).execute()
-                if 'messages' in result:
-                    messages.extend(result['messages'])
+                ).execute)
+                messages.extend(result.get('messages', []))
+                page_token = result.get('nextPageToken')
+                if not page_token:
+                    break
             print(f"Found {len(messages)} messages with attachments")
             return messages
         except HttpError as error:
             print(f"An error occurred during search: {error}")
             return []
 
-    def get_message_details(self, message_id: str) -> Optional[Dict[str, Any]]:
-        try:
-            message = self.gmail_service.users().messages().get(
-                userId='me', id=message_id, format='full'
-            ).execute()
-            return message
-        except HttpError as error:
-            print(f"Error getting message {message_id}: {error}")
-            return None
+    def _fetch_message_batch(self, message_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch up to BATCH_SIZE full messages in a single batch request.
+        Messages rejected with a transient error are re-batched after a backoff.
+        """
+        gmail_service, _ = self._thread_services()
+        details = {}
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            retry_ids = []
+
+            def callback(request_id, response, exception):
+                if exception is None:
+                    details[request_id] = response
+                elif (isinstance(exception, HttpError)
+                        and exception.resp.status in self.RETRYABLE_STATUS_CODES
+                        and attempt < self.MAX_RETRIES):
+                    retry_ids.append(request_id)
+                else:
+                    print(f"Error getting message {request_id}: {exception}")
+
+            batch = gmail_service.new_batch_http_request(callback=callback)
+            for message_id in message_ids:
+                batch.add(
+                    gmail_service.users().messages().get(
+                        userId='me', id=message_id, format='full', fields=self.MESSAGE_FIELDS
+                    ),
+                    request_id=message_id
+                )
+            try:
+                self._with_retry(batch.execute)
+            except HttpError as error:
+                print(f"Error executing batch request: {error}")
+                break
+            if not retry_ids:
+                break
+            message_ids = retry_ids
+            self._backoff(attempt)
+        return details
 
     def extract_message_info(self, message: Dict[str, Any]) -> Dict[str, Any]:
         headers = message['payload'].get('headers', [])
@@ -133,27 +305,36 @@ class GmailAttachmentDownloader:
             'date': '',
             'internal_date': message.get('internalDate', '')
         }
+        wanted = {'subject', 'from', 'date'}
         for header in headers:
             name = header['name'].lower()
-            if name == 'subject':
-                info['subject'] = header['value']
-            elif name == 'from':
-                info['from'] = header['value']
-            elif name == 'date':
-                info['date'] = header['value']
+            if name in wanted:
+                info[name] = header['value']
+                wanted.discard(name)
+                if not wanted:
+                    break
         return info
 
-    def upload_file_to_drive(self, file_data: bytes, filename: str, mimetype: str) -> Optional[str]:
-        """Upload a file to Google Drive root, return file ID if successful."""
+    def upload_file_to_drive(self, fd: io.IOBase, filename: str, mimetype: str) -> Optional[str]:
+        """Upload a seekable file object to Google Drive, return file ID if successful."""
         try:
-            file_metadata = {'name': filename, 'parents': ["0ANiWPPimuH4hUk9PVA"]}
-            media = MediaIoBaseUpload(io.BytesIO(file_data), mimetype=mimetype, resumable=True)
-            file = self.drive_service.files().create(
+            file_metadata = {'name': filename, 'parents': [self.DRIVE_FOLDER_ID]}
+            media = MediaIoBaseUpload(
+                fd,
+                mimetype=mimetype,
+                chunksize=self.UPLOAD_CHUNK_SIZE,
+                resumable=True
+            )
+            _, drive_service = self._thread_services()
+            request = drive_service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id',
                 supportsAllDrives=True
-            ).execute()
+            )
+            file = None
+            while file is None:
+                _, file = self._with_retry(request.next_chunk)
             print(f"Uploaded to Drive: {filename} (file id: {file['id']})")
             return file['id']
         except HttpError as error:
@@ -165,17 +346,22 @@ class GmailAttachmentDownloader:
         message_id: str, 
         attachment_id: str,
         filename: str, 
-        mime_type: str
+        mime_type: str,
+        data: Optional[str] = None
     ) -> bool:
-        """Download attachment from Gmail and upload to Google Drive."""
+        """
+        Download attachment from Gmail and upload to Google Drive.
+        If the message payload already carried the attachment body inline,
+        pass it as `data` to skip the attachments.get round-trip.
+        """
         try:
-            attachment = self.gmail_service.users().messages().attachments().get(
-                userId='me', messageId=message_id, id=attachment_id
-            ).execute()
-            data = attachment['data']
-            file_data = base64.urlsafe_b64decode(data.encode('UTF-8'))
-
-            file_id = self.upload_file_to_drive(file_data, filename, mime_type)
+            if data is None:
+                gmail_service, _ = self._thread_services()
+                attachment = self._with_retry(gmail_service.users().messages().attachments().get(
+                    userId='me', messageId=message_id, id=attachment_id
+                ).execute)
+                data = attachment['data']
+            file_id = self.upload_file_to_drive(Base64StreamReader(data), filename, mime_type)
             return file_id is not None
         except HttpError as error:
             print(f"Error downloading/uploading {filename}: {error}")
@@ -186,47 +372,135 @@ class GmailAttachmentDownloader:
 
     def process_message_parts(
         self,
-        parts: List[Dict[str, Any]],
-        message_id: str,
-        message_info: Dict[str, Any],
-        logger=None
-    ) -> List[Dict[str, Any]]:
-        """Find and upload .pdf/.docx attachments to Drive root."""
-        attachments_info = []
-        for part in parts:
+        parts: List[Dict[str, Any]]
+    ) -> List[Tuple[Dict[str, Any], str, Optional[str]]]:
+        """Collect .pdf/.docx attachments as (attachment_info, upload mimetype, inline data) tuples."""
+        attachments = []
+        stack = deque(parts)
+        while stack:
+            part = stack.popleft()
             filename = part.get('filename', '')
             mime_type = part.get('mimeType', '')
 
-            is_pdf = (filename and filename.lower().endswith('.pdf')) or mime_type == 'application/pdf'
-            is_docx = (filename and filename.lower().endswith('.docx')) or mime_type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+            lower_filename = filename.lower()
+            is_pdf = lower_filename.endswith('.pdf') or mime_type == self.PDF_MIME_TYPE
+            is_docx = lower_filename.endswith('.docx') or mime_type == self.DOCX_MIME_TYPE
 
             if is_pdf or is_docx:
                 body = part.get('body', {})
                 attachment_id = body.get('attachmentId')
-                if attachment_id:
-                    success = self.download_attachment_and_upload_to_drive(
-                        message_id,
-                        attachment_id,
-                        filename,
-                        mime_type or ("application/pdf" if is_pdf else "application/vnd.openxmlformats-officedocument.wordprocessingml.document")
-                    )
+                inline_data = body.get('data')
+                if attachment_id or inline_data:
                     attachment_info = {
                         'filename': filename,
                         'attachment_id': attachment_id,
                         'size': body.get('size', 0),
                         'mime_type': mime_type,
-                        'uploaded': success,
-                        'destination': "Google Drive" if success else None
+                        'uploaded': False,
+                        'destination': None
                     }
-                    attachments_info.append(attachment_info)
-                    if logger:
-                        logger(message_info, attachment_info)
+                    attachments.append((
+                        attachment_info,
+                        mime_type or (self.PDF_MIME_TYPE if is_pdf else self.DOCX_MIME_TYPE),
+                        inline_data
+                    ))
 
             if 'parts' in part:
-                attachments_info.extend(self.process_message_parts(
-                    part['parts'], message_id, message_info, logger
-                ))
-        return attachments_info
+                # Visit nested parts next, preserving depth-first document order
+                stack.extendleft(reversed(part['parts']))
+        return attachments
+
+    async def _process_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        logger=None,
+        on_message_done=None
+    ) -> Dict[str, int]:
+        """
+        Fetch messages batch by batch and upload their attachments concurrently.
+        Each batch's payloads are dropped once its attachments are collected, and its
+        transfers run while the next batch is fetched. Fetching pauses while more than
+        BATCH_SIZE messages are still transferring, bounding the inline data held.
+        Args:
+            messages: Message stubs from search_messages_with_attachments
+            logger: Called with (message_info, attachment_info) after each transfer
+            on_message_done: Called with (message_info, attachment_infos) once all of a
+                message's transfers have finished
+        Returns:
+            Counts for failed_messages, total_attachments and successful_uploads
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_TRANSFERS)
+        counts = {'failed_messages': 0, 'total_attachments': 0, 'successful_uploads': 0}
+        in_flight = set()
+        finished = []
+
+        def on_task_done(task):
+            in_flight.discard(task)
+            finished.append(task)
+
+        def raise_task_errors():
+            # Re-raise the first failure (e.g. a log write error) so the run stops instead of losing it
+            while finished:
+                finished.pop().result()
+
+        with ThreadPoolExecutor(max_workers=1) as fetcher, \
+                ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_TRANSFERS) as executor:
+            async def transfer(message_info, attachment_info, upload_mime_type, inline_data):
+                async with semaphore:
+                    success = await loop.run_in_executor(
+                        executor,
+                        self.download_attachment_and_upload_to_drive,
+                        message_info['id'],
+                        attachment_info['attachment_id'],
+                        attachment_info['filename'],
+                        upload_mime_type,
+                        inline_data
+                    )
+                attachment_info['uploaded'] = success
+                attachment_info['destination'] = "Google Drive" if success else None
+                if success:
+                    counts['successful_uploads'] += 1
+                if logger:
+                    logger(message_info, attachment_info)
+
+            async def transfer_message(message_info, attachments):
+                await asyncio.gather(*(transfer(message_info, *a) for a in attachments))
+                if on_message_done:
+                    on_message_done(message_info, [attachment_info for attachment_info, _, _ in attachments])
+
+            for start in range(0, len(messages), self.BATCH_SIZE):
+                while len(in_flight) > self.BATCH_SIZE:
+                    await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                raise_task_errors()
+
+                message_ids = [m['id'] for m in messages[start:start + self.BATCH_SIZE]]
+                print(f"\nFetching messages {start + 1}-{start + len(message_ids)} of {len(messages)}...")
+                details = await loop.run_in_executor(fetcher, self._fetch_message_batch, message_ids)
+
+                for i, message_id in enumerate(message_ids, start + 1):
+                    print(f"\nProcessing message {i}/{len(messages)}: {message_id}")
+                    message_details = details.pop(message_id, None)
+                    if not message_details:
+                        counts['failed_messages'] += 1
+                        continue
+                    message_info = self.extract_message_info(message_details)
+                    print(f"Subject: {message_info['subject']}")
+                    print(f"From: {message_info['from']}")
+                    print(f"Date: {message_info['date']}")
+
+                    parts = message_details.get('payload', {}).get('parts', [])
+                    if parts:
+                        attachments = self.process_message_parts(parts)
+                        counts['total_attachments'] += len(attachments)
+                        task = asyncio.ensure_future(transfer_message(message_info, attachments))
+                        in_flight.add(task)
+                        task.add_done_callback(on_task_done)
+
+            if in_flight:
+                await asyncio.wait(in_flight)
+            raise_task_errors()
+        return counts
 
     def download_attachments_in_date_range(
         self,
@@ -253,60 +527,59 @@ class GmailAttachmentDownloader:
                 print("No messages with attachments found in the specified date range.")
                 return {
                     'total_messages': 0,
+                    'failed_messages': 0,
                     'total_attachments': 0,
                     'successful_uploads': 0,
                     'failed_uploads': 0,
                 }
 
-            download_log = []
-            total_attachments = 0
-            successful_uploads = 0
-            failed_uploads = 0
-
             def real_time_logger(message_info, attachment_info):
                 print(f"[LOG] Uploaded: {attachment_info['filename']} | Status: {'Success' if attachment_info['uploaded'] else 'Failed'} | From: {message_info['from']} | Subject: {message_info['subject']}")
 
-            for i, message in enumerate(messages, 1):
-                print(f"\nProcessing message {i}/{len(messages)}: {message['id']}")
-                message_details = self.get_message_details(message['id'])
-                if not message_details:
-                    continue
-                message_info = self.extract_message_info(message_details)
-                print(f"Subject: {message_info['subject']}")
-                print(f"From: {message_info['from']}")
-                print(f"Date: {message_info['date']}")
-
-                payload = message_details.get('payload', {})
-                parts = payload.get('parts', [])
-                if parts:
-                    attachments = self.process_message_parts(
-                        parts, message['id'], message_info,
-                        logger=real_time_logger if real_time_log else None
-                    )
-                    total_attachments += len(attachments)
-                    successful_uploads += sum(1 for a in attachments if a['uploaded'])
-                    failed_uploads += sum(1 for a in attachments if not a['uploaded'])
-                    download_log.append({
-                        'message_info': message_info,
-                        'attachments': attachments
-                    })
-
-            if save_log and download_log:
-                log_file = f'drive_upload_log_{start_date}_to_{end_date}.json'
-                with open(log_file, 'w', encoding='utf-8') as f:
-                    json.dump(download_log, f, indent=2, ensure_ascii=False)
-                print(f"\nUpload log saved to: {log_file}")
+            # Stream one JSON object per message so progress survives a crash or Ctrl-C;
+            # like the old .json log, a rerun of the same range overwrites it
+            log_file = f'drive_upload_log_{start_date}_to_{end_date}.jsonl'
+            log_f = None
+            logged_entries = 0
+
+            def write_log_entry(message_info, attachment_infos):
+                nonlocal log_f, logged_entries
+                if log_f is None:
+                    log_f = open(log_file, 'wb', buffering=1 << 16)
+                entry = {'message_info': message_info, 'attachments': attachment_infos}
+                log_f.write(dumps_json_line(entry))
+                logged_entries += 1
+                if logged_entries % self.LOG_FLUSH_INTERVAL == 0:
+                    log_f.flush()
+
+            completed = False
+            try:
+                counts = asyncio.run(self._process_messages(
+                    messages,
+                    logger=real_time_logger if real_time_log else None,
+                    on_message_done=write_log_entry if save_log else None
+                ))
+                completed = True
+            finally:
+                if log_f:
+                    log_f.close()
+                    if completed:
+                        print(f"\nUpload log saved to: {log_file}")
+                    else:
+                        print(f"\nRun interrupted; partial upload log ({logged_entries} emails) saved to: {log_file}")
 
             summary = {
                 'total_messages': len(messages),
-                'total_attachments': total_attachments,
-                'successful_uploads': successful_uploads,
-                'failed_uploads': failed_uploads,
+                'failed_messages': counts['failed_messages'],
+                'total_attachments': counts['total_attachments'],
+                'successful_uploads': counts['successful_uploads'],
+                'failed_uploads': counts['total_attachments'] - counts['successful_uploads'],
                 'location': "Google Drive",
             }
 
             print(f"\n=== SUMMARY ===")
             print(f"Messages processed: {summary['total_messages']}")
+            print(f"Messages that could not be fetched: {summary['failed_messages']}")
             print(f"Total attachments: {summary['total_attachments']}")
             print(f"Successfully uploaded: {summary['successful_uploads']}")
             print(f"Failed uploads: {summary['failed_uploads']}")